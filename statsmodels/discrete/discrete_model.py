@@ -1461,7 +1461,7 @@ class Poisson(CountModel):
         L = np.exp(np.dot(X,params) + offset + exposure)
         return (self.endog - L)[:,None] * X
 
-    def score_factor(self, params):
+    def score_factor(self, params, endog=None):
         """
         Poisson model score_factor for each observation
 
@@ -1469,6 +1469,9 @@ class Poisson(CountModel):
         ----------
         params : array_like
             The parameters of the model
+        endog : array_like, optional
+            Values of the endogenous variable at which the score factor is
+            evaluated. Default is the model endog.
 
         Returns
         -------
@@ -1489,7 +1492,8 @@ class Poisson(CountModel):
         exposure = getattr(self, "exposure", 0)
         X = self.exog
         L = np.exp(np.dot(X,params) + offset + exposure)
-        return (self.endog - L)
+        y = self.endog if endog is None else endog
+        return (y - L)
 
     def hessian(self, params):
         """
@@ -1658,6 +1662,13 @@ class Poisson(CountModel):
         prob_nz = - np.expm1(-mu)
         return prob_nz
 
+    def _logprob_zero(self, mu, params=None):
+        """Log probability that count is zero
+
+        internal use in Censored model, will be refactored or removed
+        """
+        return -mu
+
     def _var(self, mu, params=None):
         """variance implied by the distribution
 
@@ -2205,8 +2216,8 @@ class GeneralizedPoisson(CountModel):
         elif which == 'prob':
             if y_values is None:
                 y_values = np.atleast_2d(np.arange(0, np.max(self.endog)+1))
-            mu = self.predict(params, exog=exog, exposure=exposure,
-                              offset=offset)[:, None]
+            # exposure is already in log, reuse linpred
+            mu = np.exp(linpred)[:, None]
             return genpoisson_p.pmf(y_values, mu, params[-1],
                                     self.parameterization + 1)
         else:
@@ -2254,13 +2265,20 @@ class GeneralizedPoisson(CountModel):
     def _prob_nonzero(self, mu, params):
         """Probability that count is not zero
 
+        internal use in Censored model, will be refactored or removed
+        """
+        # expm1 is accurate if prob_zero is close to 1
+        prob_nz = - np.expm1(self._logprob_zero(mu, params))
+        return prob_nz
+
+    def _logprob_zero(self, mu, params):
+        """Log probability that count is zero
+
         internal use in Censored model, will be refactored or removed
         """
         alpha = params[-1]
         pm1 = self.parameterization  # p-1 in GPP
-        prob_zero = np.exp(- mu / (1 + alpha * mu**pm1))
-        prob_nz = 1 - prob_zero
-        return prob_nz
+        return - mu / (1 + alpha * mu**pm1)
 
     @Appender(Poisson.get_distribution.__doc__)
     def get_distribution(self, params, exog=None, exposure=None, offset=None):
@@ -3965,7 +3983,7 @@ class NegativeBinomialP(CountModel):
         dparams = ((a4 * dgpart -
                    a3 / a2) +
                    y / mu + a4 * (1 - a3 / a2 + np.log(a1 / a2)))
-        dparams = (mu * dparams).T
+        dparams = mu * dparams
         dalpha = (-a1 / alpha * (dgpart +
                                  np.log(a1 / a2) +
                                  1 - a3 / a2))
@@ -4261,7 +4279,8 @@ class NegativeBinomialP(CountModel):
             if y_values is None:
                 y_values = np.atleast_2d(np.arange(0, np.max(self.endog)+1))
 
-            mu = self.predict(params, exog, exposure, offset)
+            # exposure is already in log, reuse linpred
+            mu = np.exp(linpred)
             size, prob = self.convert_params(params, mu)
             return nbinom.pmf(y_values, size[:, None], prob[:, None])
         else:
@@ -4317,12 +4336,21 @@ class NegativeBinomialP(CountModel):
     def _prob_nonzero(self, mu, params):
         """Probability that count is not zero
 
+        internal use in Censored model, will be refactored or removed
+        """
+        # expm1 is accurate if prob_zero is close to 1
+        prob_nz = - np.expm1(self._logprob_zero(mu, params))
+        return prob_nz
+
+    def _logprob_zero(self, mu, params):
+        """Log probability that count is zero
+
         internal use in Censored model, will be refactored or removed
         """
         alpha = params[-1]
         p = self.parameterization
-        prob_nz = 1 - (1 + alpha * mu**(p-1))**(- 1 / alpha)
-        return prob_nz
+        size = mu**(2 - p) / alpha
+        return - size * np.log1p(alpha * mu**(p - 1))
 
     @Appender(Poisson.get_distribution.__doc__)
     def get_distribution(self, params, exog=None, exposure=None, offset=None):
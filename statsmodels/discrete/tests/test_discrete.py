@@ -1745,6 +1745,34 @@ def test_predict_with_exposure():
     assert_allclose(pred2, expected2)
 
 
+def test_predict_prob_exposure():
+    # which="prob" used to fail for models with exposure
+    from statsmodels.distributions.discrete import genpoisson_p
+
+    np.random.seed(987125)
+    nobs = 50
+    exog = sm.add_constant(np.random.uniform(0, 1, size=nobs))
+    exposure = np.random.uniform(0.5, 1.5, size=nobs)
+    endog = np.random.poisson(np.exp(exog.dot([0.5, 0.5])) * exposure)
+    y_values = np.arange(5)
+
+    params = np.array([0.4, 0.6, 0.5])
+    mu = np.exp(exog.dot(params[:-1]) + np.log(exposure))[:, None]
+    for p in [1, 2]:
+        mod = NegativeBinomialP(endog, exog, exposure=exposure, p=p)
+        size, prob = mod.convert_params(params, mu)
+        probs = nbinom.pmf(y_values, size, prob)
+        assert_allclose(mod.predict(params, which="prob", y_values=y_values),
+                        probs, rtol=1e-12)
+
+    params = np.array([0.4, 0.6, 0.1])
+    for p in [1, 2]:
+        mod = GeneralizedPoisson(endog, exog, exposure=exposure, p=p)
+        probs = genpoisson_p.pmf(y_values, mu, params[-1], p)
+        assert_allclose(mod.predict(params, which="prob", y_values=y_values),
+                        probs, rtol=1e-12)
+
+
 def test_binary_pred_table_zeros():
     # see 2968
     nobs = 10
@@ -1,19 +1,28 @@
 
 import numpy as np
+import pytest
 from numpy.testing import assert_allclose, assert_equal
+from scipy import stats
 
 from statsmodels import datasets
 from statsmodels.tools.tools import add_constant
+from statsmodels.tools.numdiff import approx_fprime, approx_hess
 from statsmodels.tools.testing import Holder
 
 from statsmodels.distributions.discrete import (
+    genpoisson_p,
     truncatedpoisson,
     truncatednegbin,
     )
+from statsmodels.discrete.discrete_model import NegativeBinomialP
 from statsmodels.discrete.truncated_model import (
     TruncatedLFPoisson,
     TruncatedLFNegativeBinomialP,
+    TruncatedLFGeneralizedPoisson,
     HurdleCountModel,
+    _RCensoredGeneralizedPoisson,
+    _RCensoredNegativeBinomialP,
+    _RCensoredPoisson,
     )
 
 from statsmodels.sandbox.regression.tests.test_gmm_poisson import DATA
@@ -500,3 +509,251 @@ class TestHurdleNegbinSimulated(CheckHurdlePredict):
             exog_names=['zm_const', 'zm_x1', 'zm_alpha', 'const', 'x1',
                         'alpha'],
             )
+
+
+class SimulatedPoissonData:
+    # simulated data shared by tests of internal methods
+
+    @classmethod
+    def setup_class(cls):
+        np.random.seed(987125)
+        nobs = 300
+        exog = add_constant(np.random.uniform(0, 1, size=nobs))
+        cls.exog = exog
+        cls.endog = np.random.poisson(np.exp(exog.dot([0.5, 0.5])))
+        cls.offset = np.random.uniform(-0.5, 0.5, size=nobs)
+        cls.exposure = np.random.uniform(0.5, 1.5, size=nobs)
+        linpred = exog.dot([0.5, 0.5]) + cls.offset + np.log(cls.exposure)
+        cls.endog_offset = np.random.poisson(np.exp(linpred))
+
+        cls.models = [(TruncatedLFPoisson, {}, [0.4, 0.6]),
+                      (TruncatedLFNegativeBinomialP, {}, [0.4, 0.6, 0.3]),
+                      (TruncatedLFGeneralizedPoisson, {}, [0.4, 0.6, 0.1])]
+
+
+class TestTruncatedInternal(SimulatedPoissonData):
+
+    def test_loglikeobs(self):
+        # loglikeobs agrees with logpmf of the truncated distribution
+        endog, exog = self.endog, self.exog
+        params = np.array([0.4, 0.6])
+        for trunc in [0, 2]:
+            mod = TruncatedLFPoisson(endog, exog, truncation=trunc)
+            mu = np.exp(mod.exog.dot(params))
+            llf2 = truncatedpoisson.logpmf(mod.endog, mu, trunc)
+            assert_allclose(mod.loglikeobs(params), llf2, rtol=1e-10)
+
+        params = np.array([0.4, 0.6, 0.3])
+        for trunc in [0, 2]:
+            mod = TruncatedLFNegativeBinomialP(endog, exog, truncation=trunc)
+            mu = np.exp(mod.exog.dot(params[:-1]))
+            llf2 = truncatednegbin.logpmf(mod.endog, mu, params[-1], 2,
+                                          trunc)
+            assert_allclose(mod.loglikeobs(params), llf2, rtol=1e-10)
+
+        # parameterization p of the model also applies to the truncation
+        # region
+        params = np.array([0.4, 0.6, 0.1])
+        for p in [1, 2]:
+            for trunc in [0, 2]:
+                mod = TruncatedLFGeneralizedPoisson(endog, exog, p=p,
+                                                    truncation=trunc)
+                mu = np.exp(mod.exog.dot(params[:-1]))
+                prob_tregion = genpoisson_p.pmf(np.arange(trunc + 1),
+                                                mu[:, None], params[-1], p)
+                llf2 = (genpoisson_p.logpmf(mod.endog, mu, params[-1], p) -
+                        np.log(1 - prob_tregion.sum(1)))
+                assert_allclose(mod.loglikeobs(params), llf2, rtol=1e-10)
+
+    def test_score(self):
+        for model_class, kwds, params in self.models:
+            params = np.asarray(params)
+            for trunc in [0, 2]:
+                mod = model_class(self.endog, self.exog, truncation=trunc,
+                                  **kwds)
+                score_num = approx_fprime(params, mod.loglikeobs,
+                                          centered=True)
+                assert_allclose(mod.score_obs(params), score_num,
+                                rtol=1e-6, atol=1e-8)
+
+    def test_hessian(self):
+        for model_class, kwds, params in self.models[:2]:
+            params = np.asarray(params)
+            for trunc in [-1, 0, 2]:
+                mod = model_class(self.endog, self.exog, truncation=trunc,
+                                  **kwds)
+                hess_num = approx_hess(params, mod.loglike)
+                assert_allclose(mod.hessian(params), hess_num, rtol=1e-5)
+
+    def test_no_truncation(self):
+        # truncation=-1 is the untruncated main model
+        params = np.array([0.4, 0.6, 0.3])
+        mod = TruncatedLFNegativeBinomialP(self.endog, self.exog,
+                                           truncation=-1)
+        mod_nb = NegativeBinomialP(self.endog, self.exog)
+        assert_allclose(mod.loglikeobs(params), mod_nb.loglikeobs(params),
+                        rtol=1e-12)
+        assert_allclose(mod.score_obs(params), mod_nb.score_obs(params),
+                        rtol=1e-12)
+        assert_allclose(mod.hessian(params), mod_nb.hessian(params),
+                        rtol=1e-12)
+
+    def test_predict_moments_insample(self):
+        # in-sample predictions use cached truncation probabilities
+        for model_class, kwds, params in self.models[:2]:
+            params = np.asarray(params)
+            mod = model_class(self.endog, self.exog, truncation=2, **kwds)
+            mod.loglike(params)
+            for which in ["mean", "var"]:
+                pred1 = mod.predict(params, which=which)
+                pred2 = mod.predict(params, exog=mod.exog, which=which)
+                assert_allclose(pred1, pred2, rtol=1e-12)
+
+    def test_offset_exposure(self):
+        # offset and exposure are truncated together with endog
+        endog, exog = self.endog_offset, self.exog
+        offset, exposure = self.offset, self.exposure
+        params = np.array([0.4, 0.6])
+
+        for trunc in [0, 1]:
+            mod = TruncatedLFPoisson(endog, exog, offset=offset,
+                                     exposure=exposure, truncation=trunc)
+            mask = endog > trunc
+            mu = np.exp(exog.dot(params) + offset + np.log(exposure))[mask]
+            llf2 = truncatedpoisson.logpmf(endog[mask], mu, trunc)
+            assert_allclose(mod.loglikeobs(params), llf2, rtol=1e-10)
+
+            res = mod.fit(disp=0)
+            pred = res.predict(exog=mod.exog, offset=offset[mask],
+                               exposure=exposure[mask], which="mean-main")
+            assert_allclose(res.predict(which="mean-main"), pred,
+                            rtol=1e-12)
+
+    def test_offset_single_obs(self):
+        # offset is used if only one observation is not truncated
+        mod = TruncatedLFPoisson(np.array([0, 0, 3]), np.ones((3, 1)),
+                                 offset=np.array([0., 0., 1.]))
+        params = np.array([0.5])
+        assert_allclose(mod.predict(params, which="linear"), [1.5])
+        llf2 = truncatedpoisson.logpmf(3, np.exp(1.5), 0)
+        assert_allclose(mod.loglikeobs(params), [llf2], rtol=1e-10)
+
+    def test_fit_cache(self):
+        # cached probabilities are not kept in the fitted model
+        mod = TruncatedLFPoisson(self.endog, self.exog, truncation=2)
+        mod.fit(disp=0)
+        assert mod._cache_tregion == {}
+        mod.fit_regularized(alpha=0.01, disp=0)
+        assert mod._cache_tregion == {}
+
+    def test_remove_data(self):
+        mod = TruncatedLFPoisson(self.endog, self.exog, offset=self.offset)
+        res = mod.fit(disp=0)
+        res.remove_data()
+        assert mod._offset_main is None
+        assert mod._log_fact_endog is None
+
+
+class TestCensoredInternal(SimulatedPoissonData):
+
+    def test_loglikeobs(self):
+        # observations are in the order of endog
+        endog, exog = self.endog, self.exog
+        params = np.array([0.4, 0.6])
+
+        mod = _RCensoredPoisson(endog, exog)
+        prob_zero = np.exp(-np.exp(exog.dot(params)))
+        llf2 = np.where(endog == 0, np.log(prob_zero), np.log(1 - prob_zero))
+        assert_allclose(mod.loglikeobs(params), llf2, rtol=1e-10)
+        score_num = approx_fprime(params, mod.loglikeobs, centered=True)
+        assert_allclose(mod.score_obs(params), score_num,
+                        rtol=1e-6, atol=1e-8)
+
+    def test_fit_cache(self):
+        # cached probabilities are not kept in the fitted model
+        mod = _RCensoredPoisson(self.endog, self.exog)
+        mod.fit(disp=0)
+        assert mod._cache_llf_zero == {}
+        mod.fit_regularized(alpha=0.01, disp=0)
+        assert mod._cache_llf_zero == {}
+
+    def test_remove_data(self):
+        mod = _RCensoredPoisson(self.endog, self.exog)
+        res = mod.fit(disp=0)
+        res.remove_data()
+        assert mod._nonzero_mask is None
+
+    def test_logprob_zero(self):
+        # closed form log probability of zero agrees with main model
+        models = [(_RCensoredPoisson, {}, [0.4, 0.6]),
+                  (_RCensoredNegativeBinomialP, {"p": 2}, [0.4, 0.6, 0.5]),
+                  (_RCensoredNegativeBinomialP, {"p": 1}, [0.4, 0.6, 0.5]),
+                  (_RCensoredGeneralizedPoisson, {"p": 2}, [0.4, 0.6, 0.2])]
+        for model_class, kwds, params in models:
+            mod = model_class(self.endog, self.exog, **kwds)
+            params = np.asarray(params)
+            assert_allclose(mod._predict_llf_zero(params),
+                            mod.model_main.loglikeobs(params), rtol=1e-10)
+
+    def test_prob_nonzero(self):
+        mu = np.array([0.01, 0.5, 2, 5])
+        params = np.array([0.1, 0.7])
+        for p in [1, 2]:
+            mod = NegativeBinomialP(np.zeros(4), np.ones((4, 1)), p=p)
+            size, prob = mod.convert_params(params, mu)
+            prob_nz = stats.nbinom.sf(0, size, prob)
+            assert_allclose(mod._prob_nonzero(mu, params), prob_nz,
+                            rtol=1e-10)
+
+
+class TestHurdleFit:
+
+    @classmethod
+    def setup_class(cls):
+        cls.endog = DATA["docvis"]
+        cls.exog = DATA[['const', 'aget', 'totchr']]
+        cls.mod = HurdleCountModel(cls.endog, cls.exog)
+        cls.res = cls.mod.fit(method="newton", maxiter=300, disp=0)
+
+    def test_fit_n_jobs(self):
+        pytest.importorskip("joblib")
+        res1 = self.res
+        mod = HurdleCountModel(self.endog, self.exog)
+        res2 = mod.fit(method="newton", maxiter=300, disp=0, n_jobs=2)
+        assert_allclose(res2.params, res1.params, rtol=1e-10)
+        assert_allclose(res2.bse, res1.bse, rtol=1e-10)
+        # state set by fit of the submodels is available in the hurdle model
+        assert mod.model2.df_resid == self.mod.model2.df_resid
+        assert (res2.results_count.model.df_resid ==
+                res2.results_count.df_resid)
+        assert res2.results_zero.model is mod.model1
+
+    def test_start_params(self):
+        # warm start at the estimate of a previous fit
+        # newton fails for the negbin zero model on this data, bfgs does not
+        # report iterations but the number of score evaluations
+        for dist, method, key in [("poisson", "newton", "iterations"),
+                                  ("negbin", "bfgs", "gcalls")]:
+            if dist == "poisson":
+                res1 = self.res
+            else:
+                mod = HurdleCountModel(self.endog, self.exog, dist=dist,
+                                       zerodist=dist)
+                res1 = mod.fit(method=method, maxiter=300, disp=0)
+            assert np.isfinite(res1.params).all()
+            mod = HurdleCountModel(self.endog, self.exog, dist=dist,
+                                   zerodist=dist)
+            res2 = mod.fit(start_params=res1.params, method=method,
+                           maxiter=300, disp=0)
+            assert_allclose(res2.params, res1.params, rtol=1e-6)
+            assert res2.results_zero.mle_retvals[key] <= 2
+            assert res2.results_count.mle_retvals[key] <= 2
+
+    def test_fit_callback(self):
+        # user callback is called by the optimizer of both submodels
+        params_iter = []
+        mod = HurdleCountModel(self.endog, self.exog)
+        res = mod.fit(method="newton", disp=0, callback=params_iter.append)
+        n_iter = (res.results_zero.mle_retvals["iterations"] +
+                  res.results_count.mle_retvals["iterations"])
+        assert len(params_iter) == n_iter
@@ -4,10 +4,13 @@ __all__ = ["TruncatedLFPoisson", "TruncatedLFNegativeBinomialP",
            "HurdleCountModel"]
 
 import numpy as np
+from scipy import stats
+from scipy.special import gammaln
 import statsmodels.base.model as base
 import statsmodels.base.wrapper as wrap
 import statsmodels.regression.linear_model as lm
 from statsmodels.distributions.discrete import (
+    genpoisson_p,
     truncatedpoisson,
     truncatednegbin,
     )
@@ -21,12 +24,61 @@ from statsmodels.discrete.discrete_model import (
     GeneralizedPoisson,
     _discrete_results_docs,
     )
-from statsmodels.tools.numdiff import approx_hess
+from statsmodels.tools.numdiff import approx_fprime, approx_hess
 from statsmodels.tools.decorators import cache_readonly
-from copy import deepcopy
+from copy import copy
 
 
-class TruncatedLFGeneric(CountModel):
+def _zero_endog(endog):
+    """Zero counts for the main model of censored models
+
+    Read-only view without memory for the data of shape endog.shape.
+    """
+    return np.broadcast_to(np.zeros(1, dtype=np.float64), endog.shape)
+
+
+class _MainModelMixin:
+    """Methods for models that are derived from an unrestricted main model
+
+    internal use in truncated and censored models, subclasses define
+    model_main.
+    """
+
+    def _init_main_offset(self, offset, exposure):
+        """Offset of the main model, set in __init__ after data is selected
+
+        exposure is already in logs, offset and exposure are combined for
+        the main model.
+        """
+        if offset is None and exposure is None:
+            self._offset_main = None
+        else:
+            self._offset_main = (getattr(self, "offset", 0) +
+                                 getattr(self, "exposure", 0))
+        self._data_attr.append('_offset_main')
+        self._start_params_main = None
+
+    def _check_perfect_pred(self, params, *args):
+        """Default callback in fit, perfect prediction is not checked
+
+        cdf is not defined for the model.
+        """
+        pass
+
+    def _get_start_params(self):
+        """Start params from the fit of the main model on the same data
+
+        The estimate does not depend on fit options and is computed only
+        once for repeated calls to fit.
+        """
+        if self._start_params_main is None:
+            model = self.model_main.__class__(self.endog, self.exog,
+                                              offset=self._offset_main)
+            self._start_params_main = model.fit(disp=0).params
+        return self._start_params_main.copy()
+
+
+class TruncatedLFGeneric(_MainModelMixin, CountModel):
     __doc__ = """
     Generic Truncated model for count data
 
@@ -69,9 +121,17 @@ class TruncatedLFGeneric(CountModel):
             self.offset = self.offset[mask]
         if exposure is not None:
             self.exposure = self.exposure[mask]
+        # main model uses the truncated sample
+        self._init_main_offset(offset, exposure)
 
-        self.trunc = truncation
         self.truncation = truncation  # needed for recreating model
+        # counts in the truncation region and their log factorials are
+        # constant for the model
+        self._counts_tregion = np.arange(truncation + 1)
+        self._log_fact_tregion = gammaln(self._counts_tregion + 1)
+        # probabilities of truncation region for the last evaluated params
+        self._cache_tregion = {}
+        self._y_values_default = None
         # We cannot set the correct df_resid here, not enough information
         self._init_keys.extend(['truncation'])
         self._null_drop_keys = []
@@ -116,18 +176,22 @@ class TruncatedLFGeneric(CountModel):
         -----
 
         """
-        llf_main = self.model_main.loglikeobs(params)
+        llf_main = self._loglikeobs_main(params)
+        if self.truncation == -1:
+            # no truncation
+            return llf_main
 
-        pmf = np.zeros_like(self.endog, dtype=np.float64)
-        for i in range(self.trunc + 1):
-            model = self.model_main.__class__(np.ones_like(self.endog) * i,
-                                              self.exog)
-            pmf += np.exp(model.loglikeobs(params))
+        pmf = self._prob_tregion(params).sum(-1)
 
-        llf = llf_main - np.log(1 - pmf)
+        llf = llf_main - np.log1p(-pmf)
 
         return llf
 
+    def _loglikeobs_main(self, params):
+        """Loglikelihood for observations of the untruncated main model
+        """
+        return self.model_main.loglikeobs(params)
+
     def score_obs(self, params):
         """
         Generic Truncated model score (gradient) vector of the log-likelihood
@@ -143,20 +207,101 @@ class TruncatedLFGeneric(CountModel):
             The score vector of the model, i.e. the first derivative of the
             loglikelihood function, evaluated at `params`
         """
-        score_main = self.model_main.score_obs(params)
+        if self.truncation == -1:
+            # no truncation
+            return self.model_main.score_obs(params)
+
+        probs = self._prob_tregion(params)
+        pmf = probs.sum(-1)
+        sf_main, sf_trunc = self._score_factor_tregion(params, probs)
+
+        # combine score factors, exog is multiplied only once
+        if self.k_extra == 0:
+            sf = sf_main + sf_trunc / (1 - pmf)
+            return sf[:, None] * self.exog
+        dparams = sf_main[0] + sf_trunc[0] / (1 - pmf)
+        dextra = sf_main[1] + sf_trunc[1] / (1 - pmf)
+        return np.column_stack((dparams[:, None] * self.exog, dextra))
+
+    def _score_factor_tregion(self, params, probs):
+        """Score factors of the main model at endog and of the truncation
+
+        internal use, the score factor of the truncation is the score factor
+        of the main model weighted by the probabilities of the truncation
+        region and summed over the counts. The main model is evaluated at
+        endog and all counts of the truncation region in one call.
+        """
+        nobs = self.endog.shape[0]
+        y = np.empty((self.truncation + 2, nobs))
+        y[:-1] = self._counts_tregion[:, None]
+        y[-1] = self.endog
+        sf = self.model_main.score_factor(params, endog=y)
+        if self.k_extra == 0:
+            sf = (sf,)
+        sf_main = tuple(sf_i[-1] for sf_i in sf)
+        sf_trunc = tuple((probs * sf_i[:-1].T).sum(1) for sf_i in sf)
+        if self.k_extra == 0:
+            return sf_main[0], sf_trunc[0]
+        return sf_main, sf_trunc
+
+    def _predict_prob_tregion(self, params):
+        """Probabilities of counts in the truncation region, not cached
+        """
+        mu = self.model_main.predict(params)[:, None]
+        return self._pmf_main(params, mu, self._counts_tregion)
 
-        pmf = np.zeros_like(self.endog, dtype=np.float64)
-        score_trunc = np.zeros_like(score_main, dtype=np.float64)
-        for i in range(self.trunc + 1):
-            model = self.model_main.__class__(np.ones_like(self.endog) * i,
-                                              self.exog)
-            pmf_i = np.exp(model.loglikeobs(params))
-            score_trunc += (model.score_obs(params).T * pmf_i).T
-            pmf += pmf_i
+    def _prob_tregion(self, params):
+        """Probabilities of counts in the truncation region 0, ..., trunc
 
-        dparams = score_main + (score_trunc.T / (1 - pmf)).T
+        internal use, the results for the last two params are cached
+        because optimizers evaluate loglike and score at the same params.
 
-        return dparams
+        Returns
+        -------
+        probs : ndarray, (nobs, truncation + 1)
+            The probabilities of the main model. The array is shared with
+            the cache and should not be modified inplace.
+        """
+        key = np.asarray(params, dtype=np.float64).tobytes()
+        probs = self._cache_tregion.get(key)
+        if probs is None:
+            probs = self._predict_prob_tregion(params)
+            if len(self._cache_tregion) >= 2:
+                # drop the oldest entry, dicts keep insertion order
+                del self._cache_tregion[next(iter(self._cache_tregion))]
+            self._cache_tregion[key] = probs
+        return probs
+
+    def _moments_tregion(self, params, mu, in_sample=False):
+        """Moments of the main model over the truncation region
+
+        internal use in predict
+
+        Parameters
+        ----------
+        params : array_like
+            The model parameters.
+        mu : ndarray
+            Mean of the main model.
+        in_sample : bool
+            If True, then mu is the in-sample prediction and the cached
+            probabilities of the truncation region are used.
+
+        Returns
+        -------
+        prob_tregion, mean_tregion, mnc2_tregion : ndarray
+            Sums of the probabilities of the counts in the truncation region
+            weighted by one, by the counts and by the squared counts.
+        """
+        if in_sample:
+            probs = self._prob_tregion(params)
+        else:
+            probs = self._pmf_main(params, mu[:, None], self._counts_tregion)
+        counts = self._counts_tregion
+        prob_tregion = probs.sum(1)
+        mean_tregion = probs.dot(counts)
+        mnc2_tregion = probs.dot(counts**2)
+        return prob_tregion, mean_tregion, mnc2_tregion
 
     def score(self, params):
         """
@@ -179,12 +324,7 @@ class TruncatedLFGeneric(CountModel):
             full_output=1, disp=1, callback=None,
             cov_type='nonrobust', cov_kwds=None, use_t=None, **kwargs):
         if start_params is None:
-            offset = getattr(self, "offset", 0) + getattr(self, "exposure", 0)
-            if np.size(offset) == 1 and offset == 0:
-                offset = None
-            model = self.model_main.__class__(self.endog, self.exog,
-                                              offset=offset)
-            start_params = model.fit(disp=0).params
+            start_params = self._get_start_params()
 
         # Todo: check how we can to this in __init__
         k_params = self.df_model + 1 + self.k_extra
@@ -196,7 +336,7 @@ class TruncatedLFGeneric(CountModel):
             maxiter=maxiter,
             disp=disp,
             full_output=full_output,
-            callback=lambda x: x,
+            callback=callback,
             **kwargs
             )
 
@@ -208,6 +348,8 @@ class TruncatedLFGeneric(CountModel):
 
         result._get_robustcov_results(cov_type=cov_type,
                                       use_self=True, use_t=use_t, **cov_kwds)
+        # the cache is only needed during estimation
+        self._cache_tregion = {}
         return result
 
     fit.__doc__ = DiscreteModel.fit.__doc__
@@ -224,11 +366,8 @@ class TruncatedLFGeneric(CountModel):
 
         alpha_p = alpha
         if start_params is None:
-            offset = getattr(self, "offset", 0) + getattr(self, "exposure", 0)
-            if np.size(offset) == 1 and offset == 0:
-                offset = None
             model = self.model_main.__class__(self.endog, self.exog,
-                                              offset=offset)
+                                              offset=self._offset_main)
             start_params = model.fit_regularized(
                 start_params=start_params, method=method, maxiter=maxiter,
                 full_output=full_output, disp=0, callback=callback,
@@ -247,6 +386,8 @@ class TruncatedLFGeneric(CountModel):
             raise TypeError(
                     "argument method == %s, which is not handled" % method)
 
+        # the cache is only needed during estimation
+        self._cache_tregion = {}
         return self.result_class_reg_wrapper(discretefit)
 
     fit_regularized.__doc__ = DiscreteModel.fit_regularized.__doc__
@@ -268,8 +409,46 @@ class TruncatedLFGeneric(CountModel):
 
         Notes
         -----
+        The Hessian is the numerical derivative of the analytical score,
+        which needs fewer function evaluations than the numerical second
+        derivative of the loglikelihood.
         """
-        return approx_hess(params, self.loglike)
+        if self.truncation == -1:
+            # no truncation
+            return self.model_main.hessian(params)
+
+        hess = approx_fprime(params, self.score, centered=True)
+        # symmetrize numerical derivative
+        return (hess + hess.T) / 2
+
+    def _pmf_trunc(self, params, mu, y_values):
+        """Probabilities of the truncated model given the mean of main model
+
+        internal use, mu and y_values need to broadcast
+        """
+        if self.k_extra == 0:
+            # poisson, no extra params
+            probs = self.model_dist.pmf(y_values, mu, self.truncation)
+        elif self.k_extra == 1:
+            p = self.model_main.parameterization
+            probs = self.model_dist.pmf(y_values, mu, params[-1],
+                                        p, self.truncation)
+        else:
+            raise ValueError("k_extra is not 0 or 1")
+        return probs
+
+    def _get_y_values(self, y_values):
+        """Counts at which predicted probabilities are evaluated, 2-dim
+
+        internal use, the default grid 0, ..., max(endog) is constant for
+        the model and created only once.
+        """
+        if y_values is not None:
+            return np.atleast_2d(y_values)
+        if self._y_values_default is None:
+            self._y_values_default = np.atleast_2d(
+                np.arange(0, np.max(self.endog) + 1))
+        return self._y_values_default
 
     def predict(self, params, exog=None, exposure=None, offset=None,
                 which='mean', y_values=None):
@@ -287,6 +466,7 @@ class TruncatedLFGeneric(CountModel):
         If exposure is specified, then it will be logged by the method.
         The user does not need to log it first.
         """
+        in_sample = exog is None and offset is None and exposure is None
         exog, offset, exposure = self._get_predict_arrays(
             exog=exog,
             offset=offset,
@@ -304,13 +484,8 @@ class TruncatedLFGeneric(CountModel):
             elif self.truncation == -1:
                 return mu
             elif self.truncation > 0:
-                counts = np.atleast_2d(np.arange(0, self.truncation + 1))
-                # next is same as in prob-main below
-                probs = self.model_main.predict(
-                    params, exog=exog, exposure=np.exp(exposure),
-                    offset=offset, which="prob", y_values=counts)
-                prob_tregion = probs.sum(1)
-                mean_tregion = (np.arange(self.truncation + 1) * probs).sum(1)
+                prob_tregion, mean_tregion, _ = self._moments_tregion(
+                    params, mu, in_sample=in_sample)
                 mean = (mu - mean_tregion) / (1 - prob_tregion)
                 return mean
         elif which == 'linear':
@@ -318,42 +493,19 @@ class TruncatedLFGeneric(CountModel):
         elif which == 'mean-main':
             return np.exp(linpred)
         elif which == 'prob':
-            if y_values is not None:
-                counts = np.atleast_2d(y_values)
-            else:
-                counts = np.atleast_2d(np.arange(0, np.max(self.endog)+1))
+            counts = self._get_y_values(y_values)
             mu = np.exp(linpred)[:, None]
-            if self.k_extra == 0:
-                # poisson, no extra params
-                probs = self.model_dist.pmf(counts, mu, self.trunc)
-            elif self.k_extra == 1:
-                p = self.model_main.parameterization
-                probs = self.model_dist.pmf(counts, mu, params[-1],
-                                            p, self.trunc)
-            else:
-                raise ValueError("k_extra is not 0 or 1")
-            return probs
+            return self._pmf_trunc(params, mu, counts)
         elif which == 'prob-main':
-            if y_values is not None:
-                counts = np.atleast_2d(y_values)
-            else:
-                counts = np.atleast_2d(np.arange(0, np.max(self.endog)+1))
-            probs = self.model_main.predict(
-                params, exog=exog, exposure=np.exp(exposure),
-                offset=offset, which="prob", y_values=counts)[:, None]
+            counts = self._get_y_values(y_values)
+            mu = np.exp(linpred)[:, None]
+            probs = self._pmf_main(params, mu, counts)[:, None]
             return probs
         elif which == 'var':
             mu = np.exp(linpred)
-            counts = np.atleast_2d(np.arange(0, self.truncation + 1))
-            # next is same as in prob-main below
-            probs = self.model_main.predict(
-                params, exog=exog, exposure=np.exp(exposure),
-                offset=offset, which="prob", y_values=counts)
-            prob_tregion = probs.sum(1)
-            mean_tregion = (np.arange(self.truncation + 1) * probs).sum(1)
+            prob_tregion, mean_tregion, mnc2_tregion = self._moments_tregion(
+                params, mu, in_sample=in_sample)
             mean = (mu - mean_tregion) / (1 - prob_tregion)
-            mnc2_tregion = (np.arange(self.truncation + 1)**2 *
-                            probs).sum(1)
             vm = self.model_main._var(mu, params)
             # uncentered 2nd moment
             mnc2 = (mu**2 + vm - mnc2_tregion) / (1 - prob_tregion)
@@ -402,14 +554,87 @@ class TruncatedLFPoisson(TruncatedLFGeneric):
             **kwargs
             )
         self.model_main = Poisson(self.endog, self.exog,
-                                  exposure=exposure,
-                                  offset=offset)
+                                  offset=self._offset_main)
         self.model_dist = truncatedpoisson
+        # log factorial of endog is constant in the loglikelihood
+        self._log_fact_endog = gammaln(self.endog + 1)
+        self._data_attr.append('_log_fact_endog')
         self.result_class = TruncatedLFPoissonResults
         self.result_class_wrapper = TruncatedLFGenericResultsWrapper
         self.result_class_reg = L1TruncatedLFGenericResults
         self.result_class_reg_wrapper = L1TruncatedLFGenericResultsWrapper
 
+    def _pmf_main(self, params, mu, y_values):
+        """Probabilities of the untruncated main model given the mean
+
+        internal use, mu and y_values need to broadcast
+        """
+        return stats.poisson.pmf(y_values, mu)
+
+    def _loglikeobs_main(self, params):
+        """Loglikelihood for observations of the untruncated Poisson model
+        """
+        linpred = self.model_main.predict(params, which="linear")
+        return self.endog * linpred - np.exp(linpred) - self._log_fact_endog
+
+    def _score_factor_tregion(self, params, probs):
+        """Score factors of the main model at endog and of the truncation
+
+        internal use, closed form of the weighted sum of count - mu
+        """
+        mu = self.model_main.predict(params)
+        sf_main = self.endog - mu
+        sf_trunc = probs.dot(self._counts_tregion) - mu * probs.sum(1)
+        return sf_main, sf_trunc
+
+    def _predict_prob_tregion(self, params):
+        """Probabilities of counts in the truncation region, not cached
+        """
+        linpred = self.model_main.predict(params, which="linear")[:, None]
+        # inplace operations, only one (nobs, truncation + 1) array is created
+        probs = self._counts_tregion * linpred
+        probs -= np.exp(linpred)
+        probs -= self._log_fact_tregion
+        return np.exp(probs, out=probs)
+
+    def hessian(self, params):
+        """
+        Truncated Poisson model Hessian matrix of the loglikelihood
+
+        Parameters
+        ----------
+        params : array-like
+            The parameters of the model
+
+        Returns
+        -------
+        hess : ndarray, (k_vars, k_vars)
+            The Hessian, second derivative of loglikelihood function,
+            evaluated at `params`
+
+        Notes
+        -----
+        The Hessian is computed analytically. With :math:`p_j` the Poisson
+        probabilities of the counts :math:`j` in the truncation region and
+        :math:`P = \\sum_j p_j`, the hessian factor with respect to the
+        linear predictor is
+
+        .. math:: -\\mu + \\frac{P''}{1 - P} + \\frac{P'^2}{(1 - P)^2}
+
+        where :math:`P' = \\sum_j p_j (j - \\mu)` and
+        :math:`P'' = \\sum_j p_j ((j - \\mu)^2 - \\mu)`.
+        """
+        mu = self.model_main.predict(params)[:, None]
+        probs = self._prob_tregion(params)
+        dev = self._counts_tregion - mu
+        prob_ntrunc = 1 - probs.sum(1)
+        dprob = (probs * dev).sum(1)
+        d2prob = (probs * (dev**2 - mu)).sum(1)
+        hf = (-mu[:, 0] + d2prob / prob_ntrunc +
+              (dprob / prob_ntrunc)**2)
+        X = self.exog
+        return np.dot(hf * X.T, X)
+
     def _predict_mom_trunc0(self, params, mu):
         """Predict mean and variance of zero-truncated distribution.
 
@@ -471,8 +696,7 @@ class TruncatedLFNegativeBinomialP(TruncatedLFGeneric):
             **kwargs
             )
         self.model_main = NegativeBinomialP(self.endog, self.exog,
-                                            exposure=exposure,
-                                            offset=offset, p=p)
+                                            offset=self._offset_main, p=p)
         self.k_extra = self.model_main.k_extra
         self.exog_names.extend(self.model_main.exog_names[-self.k_extra:])
         self.model_dist = truncatednegbin
@@ -481,6 +705,14 @@ class TruncatedLFNegativeBinomialP(TruncatedLFGeneric):
         self.result_class_reg = L1TruncatedLFGenericResults
         self.result_class_reg_wrapper = L1TruncatedLFGenericResultsWrapper
 
+    def _pmf_main(self, params, mu, y_values):
+        """Probabilities of the untruncated main model given the mean
+
+        internal use, mu and y_values need to broadcast
+        """
+        size, prob = self.model_main.convert_params(params, mu)
+        return stats.nbinom.pmf(y_values, size, prob)
+
     def _predict_mom_trunc0(self, params, mu):
         """Predict mean and variance of zero-truncated distribution.
 
@@ -551,8 +783,7 @@ class TruncatedLFGeneralizedPoisson(TruncatedLFGeneric):
             )
         self.model_main = GeneralizedPoisson(self.endog,
                                              self.exog,
-                                             exposure=exposure,
-                                             offset=offset,
+                                             offset=self._offset_main,
                                              p=p)
         self.k_extra = self.model_main.k_extra
         self.exog_names.extend(self.model_main.exog_names[-self.k_extra:])
@@ -562,8 +793,16 @@ class TruncatedLFGeneralizedPoisson(TruncatedLFGeneric):
         self.result_class_reg = L1TruncatedLFGenericResults
         self.result_class_reg_wrapper = L1TruncatedLFGenericResultsWrapper
 
+    def _pmf_main(self, params, mu, y_values):
+        """Probabilities of the untruncated main model given the mean
 
-class _RCensoredGeneric(CountModel):
+        internal use, mu and y_values need to broadcast
+        """
+        p = self.model_main.parameterization
+        return genpoisson_p.pmf(y_values, mu, params[-1], p + 1)
+
+
+class _RCensoredGeneric(_MainModelMixin, CountModel):
     __doc__ = """
     Generic right Censored model for count data
 
@@ -588,8 +827,6 @@ class _RCensoredGeneric(CountModel):
 
     def __init__(self, endog, exog, offset=None, exposure=None,
                  missing='none', **kwargs):
-        self.zero_idx = np.nonzero(endog == 0)[0]
-        self.nonzero_idx = np.nonzero(endog)[0]
         super(_RCensoredGeneric, self).__init__(
             endog,
             exog,
@@ -598,6 +835,14 @@ class _RCensoredGeneric(CountModel):
             missing=missing,
             **kwargs
             )
+        # boolean mask keeps observations in the order of endog
+        self._nonzero_mask = self.endog != 0
+        self.zero_idx = np.nonzero(~self._nonzero_mask)[0]
+        self.nonzero_idx = np.nonzero(self._nonzero_mask)[0]
+        self._data_attr.append('_nonzero_mask')
+        # log prob of zero for the last evaluated params
+        self._cache_llf_zero = {}
+        self._init_main_offset(offset, exposure)
 
     def loglike(self, params):
         """
@@ -639,12 +884,12 @@ class _RCensoredGeneric(CountModel):
         -----
 
         """
-        llf_main = self.model_main.loglikeobs(params)
+        llf_main = self._loglikeobs_zero(params)
 
-        llf = np.concatenate(
-            (llf_main[self.zero_idx],
-             np.log(1 - np.exp(llf_main[self.nonzero_idx])))
-            )
+        mask = self._nonzero_mask
+        llf = llf_main.copy()
+        # log(1 - prob_zero), expm1 is accurate if prob_zero is close to 1
+        llf[mask] = np.log(-np.expm1(llf_main[mask]))
 
         return llf
 
@@ -664,17 +909,46 @@ class _RCensoredGeneric(CountModel):
             loglikelihood function, evaluated at `params`
         """
         score_main = self.model_main.score_obs(params)
-        llf_main = self.model_main.loglikeobs(params)
+        llf_main = self._loglikeobs_zero(params)
 
-        score = np.concatenate((
-            score_main[self.zero_idx],
-            (score_main[self.nonzero_idx].T *
-             -np.exp(llf_main[self.nonzero_idx]) /
-             (1 - np.exp(llf_main[self.nonzero_idx]))).T
-            ))
+        mask = self._nonzero_mask
+        llf_nz = llf_main[mask]
+        # -prob_zero / (1 - prob_zero)
+        factor = np.exp(llf_nz) / np.expm1(llf_nz)
+        score = score_main.copy()
+        score[mask] *= factor[:, None]
 
         return score
 
+    def _predict_llf_zero(self, params):
+        """Log probability of a zero count, not cached
+
+        Uses the closed form of the main model if available, which avoids
+        the gammaln terms of the loglikelihood that vanish at zero counts.
+        """
+        logprob_zero = getattr(self.model_main, "_logprob_zero", None)
+        if logprob_zero is None:
+            return self.model_main.loglikeobs(params)
+        mu = self.model_main.predict(params)
+        return logprob_zero(mu, params)
+
+    def _loglikeobs_zero(self, params):
+        """Log probability of a zero count for each observation
+
+        internal use, the main model is evaluated at zero counts. The
+        results for the last two params are cached because optimizers
+        evaluate loglike and score at the same params.
+        """
+        key = np.asarray(params, dtype=np.float64).tobytes()
+        llf_main = self._cache_llf_zero.get(key)
+        if llf_main is None:
+            llf_main = self._predict_llf_zero(params)
+            if len(self._cache_llf_zero) >= 2:
+                # drop the oldest entry, dicts keep insertion order
+                del self._cache_llf_zero[next(iter(self._cache_llf_zero))]
+            self._cache_llf_zero[key] = llf_main
+        return llf_main
+
     def score(self, params):
         """
         Generic Censored model score (gradient) vector of the log-likelihood
@@ -696,19 +970,14 @@ class _RCensoredGeneric(CountModel):
             full_output=1, disp=1, callback=None,
             cov_type='nonrobust', cov_kwds=None, use_t=None, **kwargs):
         if start_params is None:
-            offset = getattr(self, "offset", 0) + getattr(self, "exposure", 0)
-            if np.size(offset) == 1 and offset == 0:
-                offset = None
-            model = self.model_main.__class__(self.endog, self.exog,
-                                              offset=offset)
-            start_params = model.fit(disp=0).params
+            start_params = self._get_start_params()
         mlefit = super(_RCensoredGeneric, self).fit(
             start_params=start_params,
             method=method,
             maxiter=maxiter,
             disp=disp,
             full_output=full_output,
-            callback=lambda x: x,
+            callback=callback,
             **kwargs
             )
 
@@ -720,6 +989,8 @@ class _RCensoredGeneric(CountModel):
 
         result._get_robustcov_results(cov_type=cov_type,
                                       use_self=True, use_t=use_t, **cov_kwds)
+        # the cache is only needed during estimation
+        self._cache_llf_zero = {}
         return result
 
     fit.__doc__ = DiscreteModel.fit.__doc__
@@ -736,11 +1007,8 @@ class _RCensoredGeneric(CountModel):
 
         alpha_p = alpha
         if start_params is None:
-            offset = getattr(self, "offset", 0) + getattr(self, "exposure", 0)
-            if np.size(offset) == 1 and offset == 0:
-                offset = None
             model = self.model_main.__class__(self.endog, self.exog,
-                                              offset=offset)
+                                              offset=self._offset_main)
             start_params = model.fit_regularized(
                 start_params=start_params, method=method, maxiter=maxiter,
                 full_output=full_output, disp=0, callback=callback,
@@ -759,6 +1027,8 @@ class _RCensoredGeneric(CountModel):
             raise TypeError(
                     "argument method == %s, which is not handled" % method)
 
+        # the cache is only needed during estimation
+        self._cache_llf_zero = {}
         return self.result_class_reg_wrapper(discretefit)
 
     fit_regularized.__doc__ = DiscreteModel.fit_regularized.__doc__
@@ -812,7 +1082,7 @@ class _RCensoredPoisson(_RCensoredGeneric):
         super(_RCensoredPoisson, self).__init__(endog, exog, offset=offset,
                                                 exposure=exposure,
                                                 missing=missing, **kwargs)
-        self.model_main = Poisson(np.zeros_like(self.endog), self.exog)
+        self.model_main = Poisson(_zero_endog(self.endog), self.exog)
         self.model_dist = None
         self.result_class = TruncatedLFGenericResults
         self.result_class_wrapper = TruncatedLFGenericResultsWrapper
@@ -850,7 +1120,7 @@ class _RCensoredGeneralizedPoisson(_RCensoredGeneric):
             missing=missing, **kwargs)
 
         self.model_main = GeneralizedPoisson(
-            np.zeros_like(self.endog), self.exog)
+            _zero_endog(self.endog), self.exog)
         self.model_dist = None
         self.result_class = TruncatedLFGenericResults
         self.result_class_wrapper = TruncatedLFGenericResultsWrapper
@@ -891,7 +1161,7 @@ class _RCensoredNegativeBinomialP(_RCensoredGeneric):
             missing=missing,
             **kwargs
             )
-        self.model_main = NegativeBinomialP(np.zeros_like(self.endog),
+        self.model_main = NegativeBinomialP(_zero_endog(self.endog),
                                             self.exog,
                                             p=p
                                             )
@@ -936,7 +1206,7 @@ class _RCensored(_RCensoredGeneric):
             missing=missing,
             **kwargs
             )
-        self.model_main = model(np.zeros_like(self.endog), self.exog)
+        self.model_main = model(_zero_endog(self.endog), self.exog)
         self.model_dist = distribution
         # fix k_extra and exog_names
         self.k_extra = k_extra = self.model_main.k_extra
@@ -957,6 +1227,12 @@ class _RCensored(_RCensoredGeneric):
         return prob_nz
 
 
+def _fit_submodel(model, fit_kwds):
+    """Fit a submodel of a Hurdle model, helper for parallel estimation
+    """
+    return model.fit(**fit_kwds)
+
+
 class HurdleCountModel(CountModel):
     """
     Hurdle model for count data
@@ -995,6 +1271,10 @@ class HurdleCountModel(CountModel):
     the predicted mean, then convergence might fail, hessian might not be
     invertible or parameter estimates will have large standard errors.
 
+    The zero and the count model are estimated separately. The option
+    ``n_jobs`` of ``fit`` estimates both models in parallel using joblib if
+    it is available. The default ``n_jobs=1`` estimates them sequentially.
+
     References
     ----------
     not yet
@@ -1042,6 +1322,10 @@ class HurdleCountModel(CountModel):
                                                        p=p)
             self.k_extra2 += 1
 
+        # number of params of the zero model, params of the zero model
+        # come first in the params of the hurdle model
+        self._k_params_zero = self.model1.exog.shape[1] + self.model1.k_extra
+
     def loglike(self, params):
         """
         Loglikelihood of Generic Hurdle model
@@ -1061,40 +1345,60 @@ class HurdleCountModel(CountModel):
         -----
 
         """
-        k = int((len(params) - self.k_extra1 - self.k_extra2) / 2
-                ) + self.k_extra1
+        k = self._k_params_zero
         return (self.model1.loglike(params[:k]) +
                 self.model2.loglike(params[k:]))
 
     def fit(self, start_params=None, method='bfgs', maxiter=35,
             full_output=1, disp=1, callback=None,
-            cov_type='nonrobust', cov_kwds=None, use_t=None, **kwargs):
+            cov_type='nonrobust', cov_kwds=None, use_t=None, n_jobs=1,
+            **kwargs):
 
         if cov_type != "nonrobust":
             raise ValueError("robust cov_type currently not supported")
 
-        results1 = self.model1.fit(
-            start_params=start_params,
-            method=method, maxiter=maxiter, disp=disp,
-            full_output=full_output, callback=lambda x: x,
-            **kwargs
-            )
+        if start_params is not None:
+            # split params of the hurdle model into zero and count model
+            start_params = np.asarray(start_params)
+            k1 = self._k_params_zero
+            start_params1 = start_params[:k1]
+            start_params2 = start_params[k1:]
+        else:
+            start_params1 = start_params2 = None
 
-        results2 = self.model2.fit(
-            start_params=start_params,
+        fit_kwds = dict(
             method=method, maxiter=maxiter, disp=disp,
-            full_output=full_output, callback=lambda x: x,
+            full_output=full_output, callback=callback,
             **kwargs
             )
-
-        result = deepcopy(results1)
-        result._results.model = self
-        result.mle_retvals['converged'] = [results1.mle_retvals['converged'],
+        if n_jobs == 1:
+            results1 = self.model1.fit(start_params=start_params1, **fit_kwds)
+            results2 = self.model2.fit(start_params=start_params2, **fit_kwds)
+        else:
+            # zero and count model are estimated independently
+            from statsmodels.tools.parallel import parallel_func
+            parallel, p_func, n_jobs = parallel_func(_fit_submodel, n_jobs,
+                                                     verbose=0)
+            results1, results2 = parallel(
+                p_func(mod, dict(start_params=sp, **fit_kwds))
+                for mod, sp in [(self.model1, start_params1),
+                                (self.model2, start_params2)])
+            # submodels are fitted on copies in the worker processes, adopt
+            # them because fit sets attributes on the submodels
+            self.model1 = results1._results.model
+            self.model2 = results2._results.model
+
+        # shallow copy, attributes that differ from results1 are replaced
+        mlefit = copy(results1._results)
+        mlefit._cache = {}
+        mlefit.model = self
+        mlefit.mle_retvals = dict(results1.mle_retvals)
+        mlefit.mle_retvals['converged'] = [results1.mle_retvals['converged'],
                                            results2.mle_retvals['converged']]
-        result._results.params = np.append(results1._results.params,
-                                           results2._results.params)
+        mlefit.params = np.append(results1._results.params,
+                                  results2._results.params)
         # TODO: the following should be in __init__ or initialize
-        result._results.df_model += results2._results.df_model
+        mlefit.df_model += results2._results.df_model
         # this looks wrong attr does not exist, always 0
         self.k_extra1 += getattr(results1._results, "k_extra", 0)
         self.k_extra2 += getattr(results2._results, "k_extra", 0)
@@ -1104,18 +1408,23 @@ class HurdleCountModel(CountModel):
 
         # fix up cov_params,
         # we could use normalized cov_params directly, unless it's not used
-        from scipy.linalg import block_diag
-        result._results.normalized_cov_params = None
+        mlefit.normalized_cov_params = None
         try:
             cov1 = results1._results.cov_params()
             cov2 = results2._results.cov_params()
-            result._results.normalized_cov_params = block_diag(cov1, cov2)
+            # block diagonal, zero and count model are independent
+            k1 = cov1.shape[0]
+            k = k1 + cov2.shape[0]
+            cov = np.zeros((k, k))
+            cov[:k1, :k1] = cov1
+            cov[k1:, k1:] = cov2
+            mlefit.normalized_cov_params = cov
         except ValueError as e:
             if "need covariance" not in str(e):
                 # could be some other problem
                 raise
 
-        modelfit = self.result_class(self, result._results, results1, results2)
+        modelfit = self.result_class(self, mlefit, results1, results2)
         result = self.result_class_wrapper(modelfit)
 
         return result
@@ -1202,51 +1511,58 @@ class HurdleCountModel(CountModel):
             else:
                 exog_zero = exog
 
-        k_zeros = int((len(params) - self.k_extra1 - self.k_extra2) / 2
-                      ) + self.k_extra1
+        k_zeros = self._k_params_zero
         params_zero = params[:k_zeros]
         params_main = params[k_zeros:]
 
-        lin_pred = (np.dot(exog, params_main[:self.exog.shape[1]]) +
-                    exposure + offset)
+        lin_pred = np.dot(exog, params_main[:self.exog.shape[1]])
+        # inplace, exposure and offset are scalar zero if not used
+        if not np.isscalar(exposure) or exposure != 0:
+            lin_pred += exposure
+        if not np.isscalar(offset) or offset != 0:
+            lin_pred += offset
+
+        # branches are ordered so that only required terms are computed
+        if which == 'linear':
+            return lin_pred
+        elif which == 'mean-main':
+            return np.exp(lin_pred)
 
         # this currently is mean_main, offset, exposure for zero part ?
         mu1 = self.model1.predict(params_zero, exog=exog)
         # prob that count model applies y>0 from zero model predict
         prob_main = self.model1.model_main._prob_nonzero(mu1, params_zero)
-        prob_zero = (1 - prob_main)
-
-        mu2 = np.exp(lin_pred)
-        prob_ntrunc = self.model2.model_main._prob_nonzero(mu2, params_main)
 
-        if which == 'mean':
-            return prob_main * np.exp(lin_pred) / prob_ntrunc
-        elif which == 'mean-main':
-            return np.exp(lin_pred)
-        elif which == 'linear':
-            return lin_pred
-        elif which == 'mean-nonzero':
-            return np.exp(lin_pred) / prob_ntrunc
-        elif which == 'prob-zero':
-            return prob_zero
-        elif which == 'prob-main':
+        if which == 'prob-main':
             return prob_main
-        elif which == 'prob-trunc':
-            return 1 - prob_ntrunc
-        # not yet supported
-        elif which == 'var':
+        elif which == 'prob-zero':
+            return 1 - prob_main
+
+        mu2 = np.exp(lin_pred)
+        if which == 'var':
             # generic computation using results from submodels
-            mu = np.exp(lin_pred)
-            mt, vt = self.model2._predict_mom_trunc0(params_main, mu)
+            mt, vt = self.model2._predict_mom_trunc0(params_main, mu2)
             var_ = prob_main * vt + prob_main * (1 - prob_main) * mt**2
             return var_
         elif which == 'prob':
-            probs_main = self.model2.predict(
-                params_main, exog, np.exp(exposure), offset, which="prob",
-                y_values=y_values)
+            counts = self.model2._get_y_values(y_values)
+            probs_main = self.model2._pmf_trunc(params_main, mu2[:, None],
+                                                counts)
             probs_main *= prob_main[:, None]
-            probs_main[:, 0] = prob_zero
+            probs_main[:, 0] = 1 - prob_main
             return probs_main
+
+        prob_ntrunc = self.model2.model_main._prob_nonzero(mu2, params_main)
+        if which == 'mean':
+            # inplace, mu2 is not used anymore
+            mu2 /= prob_ntrunc
+            mu2 *= prob_main
+            return mu2
+        elif which == 'mean-nonzero':
+            mu2 /= prob_ntrunc
+            return mu2
+        elif which == 'prob-trunc':
+            return 1 - prob_ntrunc
         else:
             raise ValueError('which = %s is not available' % which)
 
@@ -1264,13 +1580,13 @@ class TruncatedLFPoissonResults(TruncatedLFGenericResults):
 
     @cache_readonly
     def _dispersion_factor(self):
-        if self.model.trunc != 0:
+        if self.model.truncation != 0:
             msg = "dispersion is only available for zero-truncation"
             raise NotImplementedError(msg)
 
         mu = np.exp(self.predict(which='linear'))
 
-        return (1 - mu / (np.exp(mu) - 1))
+        return (1 - mu / np.expm1(mu))
 
 
 class TruncatedNegativeBinomialResults(TruncatedLFGenericResults):
@@ -1281,15 +1597,16 @@ class TruncatedNegativeBinomialResults(TruncatedLFGenericResults):
 
     @cache_readonly
     def _dispersion_factor(self):
-        if self.model.trunc != 0:
+        if self.model.truncation != 0:
             msg = "dispersion is only available for zero-truncation"
             raise NotImplementedError(msg)
 
         alpha = self.params[-1]
         p = self.model.model_main.parameterization
         mu = np.exp(self.predict(which='linear'))
+        mu_p = mu if p == 2 else mu**(p-1)
 
-        return (1 - alpha * mu**(p-1) / (np.exp(mu**(p-1)) - 1))
+        return (1 - alpha * mu_p / np.expm1(mu_p))
 
 
 class L1TruncatedLFGenericResults(L1CountResults, TruncatedLFGenericResults):